@@ -50,13 +50,17 @@ if [ -f "$(process_exporter_tar_path)" ] && process_exporter_checksum; then
     echo "$(process_exporter_filename) already exists, skipping download"
 else
     mkdir -p "$PROCESS_EXPORTER_DIR"
-    curl -L -o "$(process_exporter_tar_path)" "$(process_exporter_url)"
+    curl --fail --retry 5 --retry-delay 2 -sS -L -o "$(process_exporter_tar_path)" "$(process_exporter_url)"
     if ! process_exporter_checksum; then
         echo "$(process_exporter_filename) download failed"
         exit 1
     fi
 fi
 
+if [ "$1" = "--download-only" ]; then
+    exit 0
+fi
+
 tar -xzf "$(process_exporter_tar_path)" --strip-components=1 -C "$PROCESS_EXPORTER_DIR" "$(process_exporter_base_name)/process-exporter"
 cp process-exporter.service /usr/lib/systemd/system/
 cp process-exporter.yml "$PROCESS_EXPORTER_DIR"